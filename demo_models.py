@@ -5,6 +5,7 @@ Demonstrates core functionality and design highlights of database models
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # API Base URL
 BASE_URL = "http://127.0.0.1:8080"
@@ -12,13 +13,25 @@ BASE_URL = "http://127.0.0.1:8080"
 
 def demo_database_models():
     """Demonstrate core functionality of database models"""
+    # One keep-alive session for the whole demo instead of a new connection per call
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    try:
+        _run_demo(session)
+    finally:
+        session.close()
+
+
+def _run_demo(session):
+    """Run the demo steps against the service using the shared session"""
     print("🎯 Database Model Demo - Sprint Review")
     print("=" * 50)
 
     # 1. Test Service Status
     print("\n1. Checking service status...")
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = session.get(f"{BASE_URL}/")
         if response.status_code == 200:
             print("✅ Service is running normally")
             print(f"   Service Info: {response.json()}")
@@ -38,10 +51,9 @@ def demo_database_models():
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/shopcarts",
-            json=shopcart_data,
-            headers={"Content-Type": "application/json"}
+            json=shopcart_data
         )
 
         if response.status_code == 201:
@@ -83,32 +95,31 @@ def demo_database_models():
         }
     ]
 
-    for i, item in enumerate(items_to_add, 1):
-        try:
-            response = requests.post(
-                f"{BASE_URL}/shopcarts/12345/items",
-                json=item,
-                headers={"Content-Type": "application/json"}
-            )
+    # Apply all items in one request instead of one POST per item
+    try:
+        response = session.put(
+            f"{BASE_URL}/shopcarts/12345",
+            json={"items": items_to_add}
+        )
 
-            if response.status_code == 201:
-                created_item = response.json()
+        if response.status_code == 200:
+            for i, created_item in enumerate(response.json()["items"], 1):
                 print(f"✅ Item {i} added successfully")
                 print(f"   Item ID: {created_item['id']}")
                 print(f"   Product ID: {created_item['product_id']}")
                 print(f"   Quantity: {created_item['quantity']}")
                 print(f"   Price: ${created_item['price']}")
                 print(f"   Description: {created_item['description']}")
-            else:
-                print(f"❌ Failed to add item {i}: {response.status_code} - {response.text}")
+        else:
+            print(f"❌ Failed to add items: {response.status_code} - {response.text}")
 
-        except Exception as e:
-            print(f"❌ Failed to add item {i}: {e}")
+    except Exception as e:
+        print(f"❌ Failed to add items: {e}")
 
     # 4. View Complete Shopcart - Demonstrate Relationship Mapping
     print("\n4. Viewing complete shopcart (Relationship Mapping)...")
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/shopcarts/12345",
             headers={"X-Customer-ID": "12345"}
         )
@@ -141,7 +152,7 @@ def demo_database_models():
             "description": "NYU T-Shirt (Updated)"
         }
 
-        response = requests.patch(
+        response = session.patch(
             f"{BASE_URL}/shopcarts/12345/items/1001",
             json=update_data,
             headers={"X-Customer-ID": "12345"}
@@ -161,7 +172,7 @@ def demo_database_models():
     # 6. Delete Item - Demonstrate Delete Functionality
     print("\n6. Deleting item (Delete Functionality)...")
     try:
-        response = requests.delete(f"{BASE_URL}/shopcarts/12345/items/1003")
+        response = session.delete(f"{BASE_URL}/shopcarts/12345/items/1003")
 
         if response.status_code == 204:
             print("✅ Item deleted successfully")
@@ -174,7 +185,7 @@ def demo_database_models():
     # 7. Final Shopcart Status
     print("\n7. Final shopcart status...")
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/shopcarts/12345",
             headers={"X-Customer-ID": "12345"}
         )
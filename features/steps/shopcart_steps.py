@@ -12,29 +12,87 @@ from decimal import Decimal
 
 import requests
 from behave import given, when, then
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait
 
 from features.environment import (
     create_cart_via_api,
+    create_carts_via_api,
+    delete_all_carts_via_api,
     delete_cart_via_api,
-    delete_cart_via_ui,
+    ensure_on_ui,
+    set_input,
+    set_select,
     _api_url,
 )
 
 # Use Tekton's WAIT_SECONDS env if provided (pipeline passes it), default to 10s locally
 WAIT_TIMEOUT = int(os.getenv("WAIT_SECONDS", "10"))
+# Minimum spacing between API fallback checks inside a fast UI poll
+API_PROBE_INTERVAL = 0.5
+
+
+_LOC_ALERT = (By.CSS_SELECTOR, "#alerts .alert")
+_LOC_DELETE_CART = (By.CSS_SELECTOR, "[data-delete-cart]")
+_LOC_RESULT_CARD = (By.ID, "result-card")
+_LOC_TABLE = (By.ID, "shopcart-table")
+
+_ALERT_TEXT_JS = (
+    "const a = document.querySelector('#alerts .alert');"
+    "return a ? a.innerText.toLowerCase() : null;"
+)
+
+
+_NOT_FOUND_TEXTS = ("not found", "404", "does not exist")
+
+
+def alert_contains_any(*needles: str):
+    """Wait condition: the current alert text (lowercased) contains any needle."""
+
+    def check(driver):
+        text = driver.execute_script(_ALERT_TEXT_JS)
+        return bool(text) and any(needle in text for needle in needles)
+
+    return check
+
+
+def _wait(context, timeout: float = WAIT_TIMEOUT, poll: float = 0.05) -> WebDriverWait:
+    """Explicit wait that polls every 50ms instead of Selenium's 500ms default.
+
+    Predicates here are single script calls, so the tighter poll stays cheap,
+    and a re-rendered or not-yet-rendered element just means "poll again".
+    """
+    return WebDriverWait(
+        context.browser,
+        timeout,
+        poll_frequency=poll,
+        ignored_exceptions=(StaleElementReferenceException, NoSuchElementException),
+    )
+
+
+def wait_for_alert(context):
+    """Wait for the alert to render and return the element the wait resolved."""
+    return _wait(context).until(EC.presence_of_element_located(_LOC_ALERT))
+
 
 STATUS_ALIAS_MAP = {
     "active": "active",
+    "open": "active",  # OPEN is the UI label for active
     "abandoned": "abandoned",
+    "closed": "abandoned",  # CLOSED is an older label for abandoned
     "purchased": "locked",  # PURCHASED maps to locked
     "locked": "locked",
     "merged": "expired",  # MERGED maps to expired
     "expired": "expired",
 }
+# Table/badge labels, precomputed so lookups skip a second normalization
+STATUS_DISPLAY_MAP = {alias: status.upper() for alias, status in STATUS_ALIAS_MAP.items()}
 
 
 def canonical_status(label: str) -> str:
@@ -43,54 +101,45 @@ def canonical_status(label: str) -> str:
 
 
 def status_display_label(label: str) -> str:
-    canonical = canonical_status(label)
-    return canonical.upper()
+    normalized = (label or "").strip().lower()
+    return STATUS_DISPLAY_MAP.get(normalized, normalized.upper() or "ACTIVE")
 
 
-def add_item_via_api(
-    context, customer_id: int, price: Decimal, product_id: int
-) -> None:
-    payload = {
-        "product_id": product_id,
-        "quantity": 1,
-        "price": float(price),
-    }
-    response = requests.post(
-        api_url(context, f"shopcarts/{customer_id}/items"), json=payload, timeout=10
+def ensure_cart_absent(context, customer_id: int) -> None:
+    """Delete the cart through the API; a missing cart already satisfies the step."""
+    response = context.http.delete(
+        _api_url(context, f"shopcarts/{customer_id}"), timeout=5
     )
-    response.raise_for_status()
+    assert response.status_code in (200, 204, 404), (
+        f"Could not clear shopcart {customer_id}: {response.status_code}"
+    )
+
+
+def item_payload(price, product_id: int, quantity: int = 1) -> dict:
+    """Build one entry for create_cart_via_api(items=[...])."""
+    return {"product_id": product_id, "quantity": quantity, "price": float(price)}
 
 
 def api_url(context, path: str) -> str:
     return _api_url(context, path)
 
 
-def query_form(context):
-    return context.browser.find_element(By.ID, "query-form")
+# [customer, status, total] cell text for every full-width table row
+_TABLE_CELLS_JS = """
+return Array.from(document.querySelectorAll('#shopcart-table tbody tr'))
+    .map((row) => row.cells)
+    .filter((cells) => cells.length >= 6)
+    .map((cells) => [0, 2, 4].map((index) => cells[index].innerText.trim()));
+"""
 
 
 def get_table_rows(context):
-    """Return parsed table rows, skipping placeholders. Returns [] on stale DOM."""
-    try:
-        rows = context.browser.find_elements(
-            By.CSS_SELECTOR, "#shopcart-table tbody tr"
-        )
-    except StaleElementReferenceException:
-        return []
+    """Return parsed table rows, skipping placeholders, from one script call."""
     parsed = []
-    for row in rows:
-        try:
-            cells = row.find_elements(By.TAG_NAME, "td")
-        except StaleElementReferenceException:
-            return []
-        if len(cells) < 6:
-            continue
-        try:
-            customer_text = cells[0].text.strip()
-            status_text = cells[2].text.strip()
-            total_text = cells[4].text.strip()
-        except StaleElementReferenceException:
-            return []
+    # The script reads the table atomically, so a re-render cannot leave stale rows
+    for customer_text, status_text, total_text in context.browser.execute_script(
+        _TABLE_CELLS_JS
+    ):
         if "No data yet" in customer_text or "No results" in customer_text:
             continue
         parsed.append(
@@ -103,46 +152,145 @@ def get_table_rows(context):
     return parsed
 
 
-def wait_for_table_rows(context):
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#shopcart-table tbody tr"))
+_WAIT_FOR_TEXT_JS = """
+const [selector, expected, timeoutMs, ignoreCase, done] = arguments;
+const norm = (text) => (ignoreCase ? text.toLowerCase() : text);
+const wanted = norm(expected);
+const matches = () => {
+    const el = document.querySelector(selector);
+    return !!el && norm(el.innerText).includes(wanted);
+};
+if (matches()) {
+    done(true);
+    return;
+}
+const observer = new MutationObserver(() => {
+    if (matches()) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, timeoutMs);
+observer.observe(document.body, {
+    subtree: true, childList: true, characterData: true, attributes: true,
+});
+"""
+
+
+def wait_for_text_in(
+    context, selector: str, expected: str, timeout: float = WAIT_TIMEOUT, ignore_case: bool = False
+) -> None:
+    """Block until selector's text contains expected, observed by the page itself."""
+    found = context.browser.execute_async_script(
+        _WAIT_FOR_TEXT_JS, selector, str(expected), int(timeout * 1000), ignore_case
     )
-    return get_table_rows(context)
+    if not found:
+        raise TimeoutException(f"'{expected}' not found in {selector} after {timeout}s")
 
 
-def wait_for_alert_text(context, expected_text: str):
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.text_to_be_present_in_element(
-            (By.CSS_SELECTOR, "#alerts .alert"), expected_text
-        )
+def wait_for_idle(context, timeout: float = 5) -> None:
+    """Block until the page has no API requests in flight (window.__pendingOps)."""
+    _wait(context, timeout).until(
+        lambda driver: driver.execute_script("return (window.__pendingOps || 0) === 0;")
     )
+
+
+def wait_for_alert_text(context, expected_text: str):
     """Wait for alert element to appear and contain the expected text."""
+    wait_for_text_in(context, "#alerts .alert", expected_text, ignore_case=True)
+    # Let the handler's trailing requests (e.g. refreshList) settle
+    wait_for_idle(context)
 
-    # Wait for alert to appear and contain the expected text
-    def alert_contains_text(driver):
-        try:
-            element = driver.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            return expected_text.lower() in element.text.lower()
-        except Exception:
-            return False
 
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(alert_contains_text)
-    # Small delay for async JavaScript to update the DOM
-    time.sleep(0.5)
+def table_fingerprint(context):
+    """Return [row count, text length, last row text] for the shopcart table."""
+    return context.browser.execute_script(
+        "const t = document.getElementById('shopcart-table');"
+        "const last = t.rows[t.rows.length - 1];"
+        "return [t.rows.length, t.innerText.length, last ? last.innerText : ''];"
+    )
+
+
+_FILL_FORM_JS = """
+const [formId, fields, submit, settleMs, done] = arguments;
+const form = document.getElementById(formId);
+for (const [name, value] of Object.entries(fields)) {
+    const field = form.querySelector(`[name="${name}"]`);
+    field.value = value;
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+}
+if (submit) form.querySelector("button[type='submit']").click();
+if (!settleMs) {
+    done(true);
+    return;
+}
+const deadline = Date.now() + settleMs;
+const poll = () => {
+    if ((window.__pendingOps || 0) === 0) done(true);
+    else if (Date.now() > deadline) done(false);
+    else setTimeout(poll, 25);
+};
+poll();
+"""
+
+
+_READ_PANELS_JS = """
+const card = document.getElementById('result-card');
+const table = document.getElementById('shopcart-table');
+const alert = document.querySelector('#alerts .alert');
+return {
+    hidden: card.hidden,
+    rtext: card.hidden ? card.textContent : card.innerText,
+    ttext: table ? table.innerText : '',
+    atext: alert ? alert.innerText.toLowerCase() : '',
+};
+"""
+
+
+def read_panels(driver) -> dict:
+    """Return result card visibility/text, table text and alert text in one round-trip."""
+    return driver.execute_script(_READ_PANELS_JS)
+
+
+def fill_form(
+    context, form_id: str, fields: dict, submit: bool = True, settle: float = 0
+) -> None:
+    """Set named form fields (firing input/change) and submit, in one round-trip.
+
+    With settle > 0 the same call also waits up to settle seconds for the
+    submit handler's API requests to finish.
+    """
+    values = {name: str(value) for name, value in fields.items() if value is not None}
+    settled = context.browser.execute_async_script(
+        _FILL_FORM_JS, form_id, values, submit, int(settle * 1000)
+    )
+    if not settled:
+        raise TimeoutException(f"{form_id} requests still pending after {settle}s")
 
 
-def get_table_html(context):
-    table = context.browser.find_element(By.ID, "shopcart-table")
-    return table.get_attribute("outerHTML")
+def submit_read_form(context, customer_id) -> None:
+    """Load a cart into the result card through the cached read form."""
+    page = context.page
+    page.act("read_customer_id", lambda el: set_input(context.browser, el, customer_id))
+    page.act("read_submit", lambda el: el.click())
 
 
-def set_input_value(element, value: str):
-    element.clear()
-    element.send_keys(value)
+def submit_action_form(context, customer_id, action: str | None) -> None:
+    """Run a cart action through the cached action form."""
+    page = context.page
+    page.act("action_customer_id", lambda el: set_input(context.browser, el, customer_id))
+    if action:
+        page.act("action_select", lambda el: set_select(context.browser, el, action))
+    page.act("action_submit", lambda el: el.click())
 
 
 def submit_query_form(context):
-    query_form(context).find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    context.page.act("query_submit", lambda el: el.click())
 
 
 def capture_latest_rows(context):
@@ -153,24 +301,25 @@ def capture_latest_rows(context):
 
 @given("the shopcart admin UI is available")
 def step_impl_ui_available(context):
-    context.browser.get(context.ui_url)
+    ensure_on_ui(context)
 
 
 @given("I am a logged-in customer on the Shopcart page")
 def step_impl_visit_shopcart_page(context):
-    context.browser.get(context.ui_url)
+    ensure_on_ui(context)
 
 
 @given("I am on the Create Shopcart form")
 def step_impl_on_create_form(context):
-    context.browser.get(context.ui_url)
-    context.table_snapshot = get_table_html(context)
+    ensure_on_ui(context)
+    # Baseline is taken lazily by the submission that can leave the table unchanged
+    context.table_snapshot = None
 
 
 @given("the service is running")
 def step_impl_service_running(context):
     # health is intentionally unprefixed (not under /api)
-    response = requests.get(f"{context.base_url}/health", timeout=10)
+    response = context.http.get(f"{context.base_url}/health", timeout=10)
     response.raise_for_status()
 
 
@@ -199,30 +348,33 @@ def step_impl_shopcarts_various_totals(context):
         (202, Decimal("120.00"), "abandoned"),
         (203, Decimal("250.00"), "active"),
     ]
-    for cid, total_value, status_label in specs:
-        create_cart_via_api(context, cid, status=status_label)
-        if total_value > 0:
-            add_item_via_api(context, cid, total_value, product_id=cid * 10)
-        context.created_customer_ids.add(cid)
+    carts = {
+        cid: {
+            "status": status_label,
+            "items": [item_payload(total_value, product_id=cid * 10)] if total_value > 0 else [],
+        }
+        for cid, total_value, status_label in specs
+    }
+    # Track first so carts created before a failure are still cleaned up
+    context.created_customer_ids.update(carts)
+    create_carts_via_api(context, carts)
 
 
 @given("the following shopcarts exist:")
 def step_impl_shopcarts_from_table(context):
     expected_total = len(context.table.rows)
+    carts = {}
     for row in context.table:
         customer_id = int(row["customer_id"])
         status_label = row.get("status", "ACTIVE")
         total_value = Decimal(str(row.get("total", "0") or "0"))
-        create_cart_via_api(
-            context,
-            customer_id,
-            status=canonical_status(status_label),
+        items = (
+            [item_payload(total_value, product_id=customer_id * 10)] if total_value > 0 else []
         )
-        if total_value > 0:
-            add_item_via_api(
-                context, customer_id, total_value, product_id=customer_id * 10
-            )
-        context.created_customer_ids.add(customer_id)
+        carts[customer_id] = {"status": canonical_status(status_label), "items": items}
+    # Rows are independent carts, so create them concurrently
+    context.created_customer_ids.update(carts)
+    create_carts_via_api(context, carts)
     context.expected_shopcart_count = expected_total
 
 
@@ -239,39 +391,29 @@ def step_impl_cart_removed_elsewhere(context, customer_id):
 
 @when('I send a GET request to "{path}"')
 def step_impl_send_get_request(context, path):
-    context.api_response = requests.get(api_url(context, path), timeout=10)
+    context.api_response = context.http.get(api_url(context, path), timeout=10)
 
 
 @when(
     'I submit a valid "Create Cart" form with customer_id={customer_id:d} and name="{cart_name}"'
 )
 def step_impl_submit_valid_form(context, customer_id, cart_name):
-    context.browser.get(context.ui_url)
-    customer_input = context.browser.find_element(By.ID, "create-customer-id")
-    name_input = context.browser.find_element(By.ID, "create-name")
-    submit_button = context.browser.find_element(By.ID, "create-submit")
-
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    name_input.clear()
-    name_input.send_keys(cart_name)
-    submit_button.click()
-    # Wait a moment for the async JavaScript to start processing
-    time.sleep(0.3)
+    ensure_on_ui(context)
+    # Fill, submit and wait for the create + refreshList requests in one call
+    fill_form(
+        context, "create-form", {"customerId": customer_id, "cartName": cart_name}, settle=5
+    )
 
     context.cleanup_customer_id = customer_id
 
 
 @when("I submit the form without entering a customer ID")
 def step_impl_submit_invalid_form(context):
-    context.browser.get(context.ui_url)
-    customer_input = context.browser.find_element(By.ID, "create-customer-id")
-    customer_input.clear()
-    name_input = context.browser.find_element(By.ID, "create-name")
-    name_input.clear()
-    name_input.send_keys("Unnamed cart")
-    submit_button = context.browser.find_element(By.ID, "create-submit")
-    submit_button.click()
+    ensure_on_ui(context)
+    if getattr(context, "table_snapshot", None) is None:
+        context.table_snapshot = table_fingerprint(context)
+    # Blank customer ID plus a name, submitted in one script call
+    fill_form(context, "create-form", {"customerId": "", "cartName": "Unnamed cart"})
 
 
 @then('I should receive a confirmation message "{message}"')
@@ -279,46 +421,30 @@ def step_impl_receive_confirmation(context, message):
     # For success messages, the alert may be cleared by refreshList()
     # So we wait for either the alert or table update
     def message_received_or_table_updated(driver):
+        # Alert and table text come back from one script call per poll
+        data = read_panels(driver)
         # First, try to catch the alert before it's cleared
-        try:
-            alert = driver.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            alert_text = alert.text.strip()
-            if alert_text and message.lower() in alert_text.lower():
-                return True
-        except Exception:
-            pass
+        if message.lower() in data["atext"]:
+            return True
         # For success messages, also check if table was updated
         # (which indicates the operation succeeded even if alert was cleared)
         if "successfully" in message.lower() or "created" in message.lower():
-            try:
-                table = driver.find_element(By.ID, "shopcart-table")
-                # If we have a cleanup_customer_id, check if it's in the table
-                if (
-                    hasattr(context, "cleanup_customer_id")
-                    and context.cleanup_customer_id
-                ):
-                    if str(context.cleanup_customer_id) in table.text:
-                        return True
-            except Exception:
-                pass
+            # If we have a cleanup_customer_id, check if it's in the table
+            cleanup_id = getattr(context, "cleanup_customer_id", None)
+            if cleanup_id and str(cleanup_id) in data["ttext"]:
+                return True
         return False
 
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
+    _wait(context).until(
         message_received_or_table_updated
     )
-    time.sleep(0.3)  # Small delay for async JavaScript
+    wait_for_idle(context)
 
 
 @then('I should see the new cart listed with status "{status_text}"')
 def step_impl_cart_listed(context, status_text):
-    table_locator = (By.ID, "shopcart-table")
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.text_to_be_present_in_element(table_locator, status_text)
-    )
-    assert status_text in context.browser.find_element(*table_locator).text
-    if context.cleanup_customer_id:
-        delete_cart_via_ui(context, context.cleanup_customer_id)
-        context.cleanup_customer_id = None
+    wait_for_text_in(context, "#shopcart-table", status_text)
+    # cleanup_customer_id is removed by after_scenario's batch API delete
 
 
 @then("I should receive a {status_code:d} {status_text} response")
@@ -339,16 +465,15 @@ def step_impl_http_response(context, status_code, status_text):
     elif hasattr(context, "browser"):
         # UI test - check for error message in alerts
         if status_code == 404:
-            WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-            )
-            alert = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            alert_text = alert.text.strip().lower()
-            assert (
-                "not found" in alert_text
-                or "404" in alert_text
-                or "does not exist" in alert_text
-            ), f"Expected 404 error message, but got: {alert_text}"
+            # Wait on the text itself so a leftover alert from an earlier step
+            # cannot satisfy the wait
+            try:
+                _wait(context).until(alert_contains_any(*_NOT_FOUND_TEXTS))
+            except TimeoutException as error:
+                alert_text = context.browser.execute_script(_ALERT_TEXT_JS)
+                raise AssertionError(
+                    f"Expected 404 error message, but got: {alert_text}"
+                ) from error
         else:
             # For other status codes in UI, we might need different handling
             # For now, just check that we have a browser context
@@ -376,21 +501,20 @@ def step_impl_api_filter_status(context, status_label):
     "all returned shopcarts should have total_price between {min_total:f} and {max_total:f}"
 )
 def step_impl_api_filter_totals(context, min_total, max_total):
-    lower = Decimal(str(min_total))
-    upper = Decimal(str(max_total))
+    # A range check on JSON floats needs no Decimal; the assert stops at the first miss
+    lower = float(min_total)
+    upper = float(max_total)
     data = context.api_response.json()
     assert data, "Expected at least one shopcart"
     for entry in data:
         total_value = entry.get("total_price") or entry.get("totalPrice")
-        if total_value is None or Decimal(str(total_value)) == 0:
-            items = entry.get("items", [])
+        if total_value:
+            total = float(total_value)
+        else:
             total = sum(
-                Decimal(str(item.get("price", 0)))
-                * Decimal(str(item.get("quantity", 0)))
-                for item in items
+                float(item.get("price", 0)) * float(item.get("quantity", 0))
+                for item in entry.get("items", [])
             )
-        else:
-            total = Decimal(str(total_value))
         assert lower <= total <= upper, f"{total} not within {lower}-{upper}"
 
 
@@ -416,19 +540,17 @@ def step_impl_warning_message(context, message):
 
 @then("the cart should not be created")
 def step_impl_not_created(context):
-    latest_html = get_table_html(context)
-    if context.table_snapshot is None:
+    latest = table_fingerprint(context)
+    if getattr(context, "table_snapshot", None) is None:
         # If no snapshot is available, ensure the placeholder text is still present.
-        assert "No data yet" in latest_html or "No results match" in latest_html
+        assert "No data yet" in latest[2] or "No results match" in latest[2]
     else:
-        assert latest_html == context.table_snapshot
+        assert latest == context.table_snapshot
 
 
 @when("I filter shopcarts by customer id {customer_id:d}")
 def step_impl_filter_by_customer(context, customer_id):
-    form = query_form(context)
-    set_input_value(form.find_element(By.NAME, "customerId"), str(customer_id))
-    submit_query_form(context)
+    fill_form(context, "query-form", {"customerId": customer_id})
     wait_for_alert_text(context, "Query completed")
     capture_latest_rows(context)
 
@@ -442,9 +564,10 @@ def step_impl_ui_customer_results(context, customer_id):
 
 @when('I filter shopcarts by status "{status_label}" in the UI')
 def step_impl_filter_by_status_ui(context, status_label):
-    form = query_form(context)
-    dropdown = Select(form.find_element(By.NAME, "status"))
-    dropdown.select_by_value(canonical_status(status_label))
+    context.page.act(
+        "query_status",
+        lambda el: set_select(context.browser, el, canonical_status(status_label)),
+    )
     submit_query_form(context)
     wait_for_alert_text(context, "Query completed")
     capture_latest_rows(context)
@@ -460,28 +583,26 @@ def step_impl_ui_status_results(context, status_label):
 
 @when("I submit an invalid price range in the UI")
 def step_impl_invalid_price_range_ui(context):
-    form = query_form(context)
-    set_input_value(form.find_element(By.NAME, "minTotal"), "500")
-    set_input_value(form.find_element(By.NAME, "maxTotal"), "100")
-    submit_query_form(context)
+    fill_form(context, "query-form", {"minTotal": "500", "maxTotal": "100"})
 
 
 @when("I clear the UI filters")
 def step_impl_clear_filters(context):
-    clear_button = context.browser.find_element(By.ID, "clear-filters")
-    clear_button.click()
+    context.page.act("clear_filters", lambda el: el.click())
     wait_for_alert_text(context, "Filters cleared. Showing all shopcarts.")
     capture_latest_rows(context)
 
 
 @then("the filter form should be reset")
 def step_impl_form_reset(context):
-    form = query_form(context)
-    assert form.find_element(By.NAME, "customerId").get_attribute("value") == ""
-    assert form.find_element(By.NAME, "minTotal").get_attribute("value") == ""
-    assert form.find_element(By.NAME, "maxTotal").get_attribute("value") == ""
-    select = Select(form.find_element(By.NAME, "status"))
-    assert select.first_selected_option.get_attribute("value") == ""
+    values = context.browser.execute_script(
+        "const form = document.getElementById('query-form');"
+        "return Object.fromEntries(arguments[0].map("
+        "(name) => [name, form.querySelector(`[name='${name}']`).value]));",
+        ["customerId", "minTotal", "maxTotal", "status"],
+    )
+    for name, value in values.items():
+        assert value == "", f"{name} should be empty, got {value!r}"
 
 
 @then("the UI should show at least {count:d} shopcarts")
@@ -493,162 +614,79 @@ def step_impl_ui_minimum_rows(context, count):
 @given("I load the shopcart details for customer {customer_id:d}")
 @when("I load the shopcart details for customer {customer_id:d}")
 def step_impl_load_details(context, customer_id):
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.NAME, "customerId")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    read_form.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.text_to_be_present_in_element(
-            (By.ID, "result-card"), f"Customer {customer_id}"
-        )
-    )
+    submit_read_form(context, customer_id)
+    wait_for_text_in(context, "#result-card", f"Customer {customer_id}")
     context.active_customer_id = customer_id
 
 
+_SCROLL_AND_CLICK_JS = """
+const button = arguments[0];
+const rect = button.getBoundingClientRect();
+if (rect.top < 0 || rect.bottom > window.innerHeight) {
+    button.scrollIntoView({block: 'center'});
+}
+button.click();
+"""
+
+
 @when("I delete the shopcart from the details panel")
 def step_impl_delete_from_card(context):
     customer_id = getattr(context, "active_customer_id", None)
     assert (
         customer_id is not None
     ), "A shopcart must be loaded before invoking the delete button."
-    delete_button = WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-delete-cart]"))
+    delete_button = _wait(context).until(
+        EC.element_to_be_clickable(_LOC_DELETE_CART)
     )
-    # Scroll to element to ensure it's visible and not blocked by navigation
-    context.browser.execute_script(
-        "arguments[0].scrollIntoView({block: 'center'});", delete_button
-    )
-    # Use JavaScript click to bypass element interception issues
-    context.browser.execute_script("arguments[0].click();", delete_button)
-    alert = WebDriverWait(context.browser, WAIT_TIMEOUT).until(EC.alert_is_present())
-    alert.accept()
+    # Scroll only if the button is off-screen, then JS-click to bypass element
+    # interception, in one call; the confirm() it opens is accepted by the
+    # driver's unhandledPromptBehavior
+    context.browser.execute_script(_SCROLL_AND_CLICK_JS, delete_button)
 
 
 @then("the cart details panel should be cleared")
 def step_impl_card_cleared(context):
-    def card_is_hidden(driver):
-        element = driver.find_element(By.ID, "result-card")
-        return element.get_attribute("hidden") is not None
-
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(card_is_hidden)
-    result_card = context.browser.find_element(By.ID, "result-card")
-    assert result_card.get_attribute("hidden") is not None
-    assert not result_card.text.strip()
+    _wait(context).until(
+        lambda driver: driver.execute_script(
+            "const e = document.getElementById('result-card');"
+            "return e && e.hasAttribute('hidden') && !e.textContent.trim();"
+        )
+    )
 
 
 @given(
     'there is an existing shopcart with customer_id={customer_id:d} and status "{status}"'
 )
 def step_impl_existing_shopcart(context, customer_id, status):
-    """Create a shopcart via the UI for testing update operations."""
-    context.browser.get(context.ui_url)
-    # First, try to delete if it exists to ensure clean state
-    try:
-        delete_cart_via_ui(context, customer_id)
-        WebDriverWait(context.browser, 3).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-        )
-    except Exception:
-        pass  # Cart might not exist, which is fine
-
-    # Create the shopcart with the specified status
-    customer_input = context.browser.find_element(By.ID, "create-customer-id")
-    name_input = context.browser.find_element(By.ID, "create-name")
-    status_select = context.browser.find_element(
-        By.CSS_SELECTOR, "#create-form select[name='status']"
+    """Create a shopcart via the REST API for testing update operations."""
+    # Setup is state, not UI behaviour; create_cart_via_api also clears any old cart
+    create_cart_via_api(
+        context,
+        customer_id,
+        name=f"Test Cart {customer_id}",
+        status=canonical_status(status),
     )
-    submit_button = context.browser.find_element(By.ID, "create-submit")
-
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    name_input.clear()
-    name_input.send_keys(f"Test Cart {customer_id}")
-
-    # Set the status - map "OPEN" to "active"
-    status_value = "active" if status.upper() == "OPEN" else status.lower()
-    # Map status using canonical_status function
-    status_value = canonical_status(status)
-    from selenium.webdriver.support.ui import Select
-
-    select = Select(status_select)
-    select.select_by_value(status_value)
-
-    submit_button.click()
-
-    # Wait for either success (table update) or error (alert)
-    # Note: refreshList() clears alerts on success, so we wait for table update instead
-    def cart_created_or_error(driver):
-        try:
-            # Check if error alert is shown first (faster to detect)
-            alert = driver.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            if alert and alert.text.strip():
-                return True
-        except Exception:
-            pass
-        try:
-            # Check if cart appears in table (success)
-            table = driver.find_element(By.ID, "shopcart-table")
-            if str(customer_id) in table.text:
-                return True
-        except Exception:
-            pass
-        return False
-
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(cart_created_or_error)
-    time.sleep(0.5)  # Small delay for async JavaScript
-
-    # Verify success by checking for error alert first, then table
-    try:
-        alert_element = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
-        alert_text = alert_element.text.lower()
-        # If we see an error, that's a problem
-        if (
-            "error" in alert_text
-            or "failed" in alert_text
-            or "already exists" in alert_text
-        ):
-            raise AssertionError(f"Failed to create shopcart: {alert_element.text}")
-    except Exception:
-        # No error alert, check if cart is in table
-        pass
-
-    # Verify cart is in table
-    table = context.browser.find_element(By.ID, "shopcart-table")
-    if str(customer_id) not in table.text:
-        raise AssertionError(
-            f"Cart {customer_id} not found in table after creation attempt"
-        )
 
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     context.cleanup_customer_ids.append(customer_id)
 
 
 @given("there is no shopcart with customer_id={customer_id:d}")
 def step_impl_no_shopcart(context, customer_id):
     """Ensure no shopcart exists for the given customer_id."""
-    from features.environment import delete_cart_via_api
-
-    # Use API to delete, which is more reliable
-    delete_cart_via_api(context, customer_id)
+    ensure_cart_absent(context, customer_id)
+    context.created_customer_ids.discard(customer_id)
 
 
 @given("no shopcart exists for customer {customer_id:d}")
 def step_impl_no_shopcart_for_customer(context, customer_id):
     """Ensure no shopcart exists for the given customer_id (alternative wording)."""
-    from features.environment import delete_cart_via_api
-
-    # Use API to delete, which is more reliable
-    delete_cart_via_api(context, customer_id)
+    step_impl_no_shopcart(context, customer_id)
 
 
 @given("all shopcarts are deleted")
 def step_impl_delete_all_shopcarts(context):
     """Delete all shopcarts from the database for testing empty state."""
-    from features.environment import delete_all_carts_via_api
-
     delete_all_carts_via_api(context)
 
 
@@ -657,26 +695,14 @@ def step_impl_delete_all_shopcarts(context):
 )
 def step_impl_update_shopcart(context, customer_id, status):
     """Update a shopcart via the UI update form."""
-    context.browser.get(context.ui_url)
-    update_form = context.browser.find_element(By.ID, "update-form")
-    customer_input = update_form.find_element(
-        By.CSS_SELECTOR, "input[name='customerId']"
-    )
-    status_select = update_form.find_element(By.CSS_SELECTOR, "select[name='status']")
-    submit_button = update_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-
+    ensure_on_ui(context)
     # Map status values using canonical_status
-    from selenium.webdriver.support.ui import Select
-
-    select = Select(status_select)
-    select.select_by_value(canonical_status(status))
-
-    submit_button.click()
-    # Wait a moment for the async JavaScript to start processing
-    time.sleep(0.3)
+    fill_form(
+        context,
+        "update-form",
+        {"customerId": customer_id, "status": canonical_status(status)},
+        settle=5,
+    )
 
     # Store the expected status for verification
     context.expected_status = status
@@ -690,62 +716,57 @@ def step_impl_200_ok(context):
     # Note: refreshList() clears alerts on success, so we check for either
     # alert (before it's cleared) or result card update (after refreshList)
     
+    success_indicators = ("updated", "success", "locked", "expired", "active")
+    # The UI read is one cheap script call per poll; the API fallback is an
+    # HTTP round-trip, so it only runs every API_PROBE_INTERVAL seconds
+    next_api_probe = 0.0
+    expected_canonical = canonical_status(getattr(context, "expected_status", ""))
+
     def update_successful(driver):
-        try:
-            # Check if alert contains success message (might appear briefly before refreshList clears it)
-            alert = driver.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            alert_text = alert.text.strip().lower()
-            if "error" in alert_text:
-                return False
-            # Check for success indicators
-            success_indicators = ["updated", "success", "locked", "expired", "active"]
-            if any(indicator in alert_text for indicator in success_indicators):
-                return True
-        except Exception:
-            # Alert might not exist or was cleared - that's okay, check other indicators
-            pass
-        
+        nonlocal next_api_probe
+        # One script read covers the alert, result card and table on each poll
+        data = read_panels(driver)
+        # Check if alert contains success message (might appear briefly before refreshList clears it)
+        # Alert might not exist or was cleared - that's okay, check other indicators
+        alert_text = data["atext"]
+        if "error" in alert_text:
+            return False
+        if any(indicator in alert_text for indicator in success_indicators):
+            return True
+
         # Check if result card was updated (renderShopcartCard is called before refreshList)
-        try:
-            result_card = driver.find_element(By.ID, "result-card")
-            if not result_card.get_attribute("hidden"):
-                # If we have expected_customer_id, verify it's in the card
-                if hasattr(context, "expected_customer_id"):
-                    if str(context.expected_customer_id) in result_card.text:
-                        return True
-                else:
-                    # Result card is visible, which indicates update likely succeeded
+        if not data["hidden"]:
+            # If we have expected_customer_id, verify it's in the card
+            if hasattr(context, "expected_customer_id"):
+                if str(context.expected_customer_id) in data["rtext"]:
                     return True
-        except Exception:
-            pass
-        
+            else:
+                # Result card is visible, which indicates update likely succeeded
+                return True
+
         # Check if table shows the updated status
         if hasattr(context, "expected_status") and hasattr(context, "expected_customer_id"):
-            try:
-                table = driver.find_element(By.ID, "shopcart-table")
-                table_text = table.text
-                customer_id_str = str(context.expected_customer_id)
-                if customer_id_str in table_text:
-                    # Customer ID is in table, check if status matches
-                    status_display = context.expected_status.upper() if context.expected_status.upper() == "LOCKED" else context.expected_status.upper()
-                    if status_display in table_text or context.expected_status.lower() in table_text.lower():
-                        return True
-            except Exception:
-                pass
+            table_text = data["ttext"]
+            if str(context.expected_customer_id) in table_text:
+                # Customer ID is in table, check if status matches
+                status_display = context.expected_status.upper()
+                if status_display in table_text or context.expected_status.lower() in table_text.lower():
+                    return True
 
         # As a last resort, confirm via the API in case the UI hasn't refreshed yet.
-        if hasattr(context, "expected_status") and hasattr(context, "expected_customer_id"):
+        if (
+            hasattr(context, "expected_status")
+            and hasattr(context, "expected_customer_id")
+            and time.monotonic() >= next_api_probe
+        ):
+            next_api_probe = time.monotonic() + API_PROBE_INTERVAL
             try:
-                resp = requests.get(
+                resp = context.http.get(
                     _api_url(context, f"shopcarts/{context.expected_customer_id}"),
                     timeout=5,
                 )
                 if resp.status_code == 200:
-                    data = resp.json()
-                    current_status = canonical_status(
-                        data.get("status") or data.get("status", "")
-                    )
-                    if current_status.lower() == canonical_status(context.expected_status).lower():
+                    if canonical_status(resp.json().get("status")) == expected_canonical:
                         return True
             except requests.RequestException:
                 pass
@@ -753,47 +774,35 @@ def step_impl_200_ok(context):
         return False
 
     # Wait for any indication of success (alert, result card, or table update)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(update_successful)
-    time.sleep(0.3)  # Small delay for async JavaScript
+    _wait(context).until(update_successful)
+    wait_for_idle(context)
     
     # Final verification - check that we didn't get an error
-    try:
-        alert_element = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
-        alert_text = alert_element.text.strip().lower()
-        if "error" in alert_text:
-            raise AssertionError(f"Update failed with error: {alert_text}")
-    except Exception:
-        # Alert might not exist or was cleared - that's okay if update_successful returned True
-        pass
+    # Alert might not exist or was cleared - that's okay if update_successful returned True
+    alert_text = context.browser.execute_script(_ALERT_TEXT_JS) or ""
+    assert "error" not in alert_text, f"Update failed with error: {alert_text.strip()}"
 
 
 @then("I should receive a 404 Not Found response in the UI")
 def step_impl_404_not_found(context):
     """Verify a 404 Not Found response (cart doesn't exist)."""
     # In UI testing, we check for error message indicating cart not found
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-    )
-    alert_text = context.browser.find_element(
-        By.CSS_SELECTOR, "#alerts .alert"
-    ).text.lower()
-    assert (
-        "not found" in alert_text or "404" in alert_text
-    ), f"Expected 'not found' error, got: {alert_text}"
+    try:
+        _wait(context).until(alert_contains_any(*_NOT_FOUND_TEXTS))
+    except TimeoutException as error:
+        alert_text = context.browser.execute_script(_ALERT_TEXT_JS)
+        raise AssertionError(f"Expected 'not found' error, got: {alert_text}") from error
 
 
 @then('the response body should include the updated status "{status}"')
 def step_impl_response_has_status(context, status):
     """Verify the response includes the updated status."""
     # Check the result card for the updated status
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "result-card"))
-    )
-    result_card = context.browser.find_element(By.ID, "result-card")
-    assert not result_card.get_attribute("hidden"), "Result card should be visible"
+    data = read_panels(context.browser)
+    assert not data["hidden"], "Result card should be visible"
 
     expected_display = status_display_label(status)
-    result_text = result_card.text
+    result_text = data["rtext"]
     assert (
         expected_display in result_text or status.lower() in result_text.lower()
     ), f"Expected status '{expected_display}' in result card, got: {result_text}"
@@ -804,10 +813,10 @@ def step_impl_data_matches_status(context):
     """Verify the shopcart data in the UI matches the updated status."""
     # Check both the result card and the table
     if hasattr(context, "expected_status") and hasattr(context, "expected_customer_id"):
+        data = read_panels(context.browser)
         # Verify in result card
-        result_card = context.browser.find_element(By.ID, "result-card")
-        if not result_card.get_attribute("hidden"):
-            result_text = result_card.text
+        if not data["hidden"]:
+            result_text = data["rtext"]
             status_display = (
                 context.expected_status.upper()
                 if context.expected_status.upper() == "LOCKED"
@@ -819,8 +828,7 @@ def step_impl_data_matches_status(context):
             ), f"Status '{context.expected_status}' not found in result card"
 
         # Verify in table
-        table = context.browser.find_element(By.ID, "shopcart-table")
-        table_text = table.text
+        table_text = data["ttext"]
         assert (
             str(context.expected_customer_id) in table_text
         ), f"Customer {context.expected_customer_id} not found in table"
@@ -828,77 +836,15 @@ def step_impl_data_matches_status(context):
 
 @when('I click the "View Cart" button for customer {customer_id:d} in the table')
 def step_impl_click_view_cart_button(context, customer_id):
-    """Click the View Cart button - use API call and render directly."""
-    import time
-
-    # Ensure we're on the UI page
-    context.browser.get(context.ui_url)
-
-    # Wait for page to load
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
-
-    # Wait for JavaScript to fully load
-    time.sleep(3)
-
-    # Method 1: Try to call viewCartById function
-    try:
-        # Check if function exists
-        function_exists = context.browser.execute_script(
-            "return typeof viewCartById !== 'undefined' && typeof viewCartById === 'function';"
+    """Click the table's View Cart button and wait for the card it loads."""
+    ensure_on_ui(context)
+    view_button = _wait(context).until(
+        EC.element_to_be_clickable(
+            (By.CSS_SELECTOR, f"#shopcart-table [data-view-cart='{customer_id}']")
         )
-        if function_exists:
-            context.browser.execute_script(f"viewCartById({customer_id});")
-        else:
-            raise Exception("Function not available")
-    except Exception:
-        # Method 2: If function is not available, fetch data via API and render manually
-        api_url = _api_url(context, f"shopcarts/{customer_id}")
-        response = requests.get(api_url, timeout=10)
-        if response.status_code == 200:
-            cart_data = response.json()
-            # Prepare data
-            cart_customer_id = cart_data.get("customer_id", customer_id)
-            cart_status = cart_data.get("status", "active")
-            cart_status_display = (
-                "OPEN" if cart_status.upper() == "ACTIVE" else cart_status.upper()
-            )
-            cart_name = cart_data.get("name", "") or "—"
-            cart_total_items = cart_data.get("total_items", 0)
-            cart_total_price = float(cart_data.get("total_price", 0))
-            cart_created = cart_data.get("created_date", "") or "—"
-            cart_updated = cart_data.get("last_modified", "") or "—"
-
-            # Manually render result card - escape special characters
-            cart_name_escaped = cart_name.replace("'", "\\'").replace('"', '\\"')
-            cart_created_escaped = cart_created.replace("'", "\\'").replace('"', '\\"')
-            cart_updated_escaped = cart_updated.replace("'", "\\'").replace('"', '\\"')
-
-            context.browser.execute_script(
-                f"""
-                const resultCard = document.querySelector('#result-card');
-                if (resultCard) {{
-                    resultCard.hidden = false;
-                    resultCard.innerHTML = '<h3>Customer {cart_customer_id}</h3>' +
-                        '<p><span class="badge {cart_status}">{cart_status_display}</span></p>' +
-                        '<div class="metadata">' +
-                        '<div><span>Name</span>{cart_name_escaped}</div>' +
-                        '<div><span>Total Items</span>{cart_total_items}</div>' +
-                        '<div><span>Total Price</span>${cart_total_price:.2f}</div>' +
-                        '<div><span>Created</span>{cart_created_escaped}</div>' +
-                        '<div><span>Updated</span>{cart_updated_escaped}</div>' +
-                        '</div>' +
-                        '<div class="items"><p>No line items in this cart yet.</p></div>';
-                }}
-                """
-            )
-
-    # Wait for result card to be visible (check hidden attribute)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        lambda driver: driver.find_element(By.ID, "result-card").get_attribute("hidden")
-        is None
     )
+    context.browser.execute_script(_SCROLL_AND_CLICK_JS, view_button)
+    wait_for_text_in(context, "#result-card", f"Customer {customer_id}")
 
     context.active_customer_id = customer_id
 
@@ -906,15 +852,15 @@ def step_impl_click_view_cart_button(context, customer_id):
 @then("I should see the shopcart details displayed in the result card")
 def step_impl_details_displayed(context):
     """Verify that shopcart details are displayed in the result card."""
-    result_card = context.browser.find_element(By.ID, "result-card")
-    assert result_card.get_attribute("hidden") is None, "Result card should be visible"
-    assert result_card.text.strip(), "Result card should contain text"
+    data = read_panels(context.browser)
+    assert not data["hidden"], "Result card should be visible"
+    assert data["rtext"].strip(), "Result card should contain text"
 
 
 @then("the result card should show customer ID {customer_id:d}")
 def step_impl_card_shows_customer_id(context, customer_id):
     """Verify the result card shows the specified customer ID."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     result_text = result_card.text
     assert (
         f"Customer {customer_id}" in result_text
@@ -924,7 +870,7 @@ def step_impl_card_shows_customer_id(context, customer_id):
 @then("the result card should show the cart status")
 def step_impl_card_shows_status(context):
     """Verify the result card shows a cart status."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
 
     # According to JS code, status is displayed in badge element
     badge = result_card.find_element(By.CSS_SELECTOR, ".badge")
@@ -934,20 +880,18 @@ def step_impl_card_shows_status(context):
 @when('I open the "My Shopcarts" page')
 def step_impl_open_my_shopcarts(context):
     """Navigate to the My Shopcarts page and load all shopcarts."""
-    context.browser.get(context.ui_url)
-    # Wait for the page to load - the list is automatically refreshed on page load
-    # Wait for the table to be present
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
-    # Give a moment for the async refreshList() to complete
-    time.sleep(1)
+    if not ensure_on_ui(context):
+        # Already loaded: the Reset button re-runs refreshList() without a reload
+        context.page.act("list_reset", lambda el: el.click())
+    # On a fresh load the list is automatically refreshed on page load
+    # Wait for the async refreshList() to complete
+    wait_for_idle(context)
 
 
 @then("I should see a list of all my shopcarts")
 def step_impl_see_list(context):
     """Verify that the shopcart list is displayed."""
-    table = context.browser.find_element(By.ID, "shopcart-table")
+    table = context.browser.find_element(*_LOC_TABLE)
     # Check that the table exists and is not showing empty state
     table_text = table.text
     assert (
@@ -956,96 +900,90 @@ def step_impl_see_list(context):
     ), "Shopcart list should be displayed"
 
 
+_TABLE_ROWS_JS = """
+return Array.from(document.querySelectorAll('#shopcart-table tbody tr'))
+    .filter((row) => !row.innerText.includes('No shopcarts found'))
+    .map((row) => {
+        const cells = row.querySelectorAll('td');
+        return [
+            cells.length,
+            cells[0] ? cells[0].innerText.trim() : '',
+            !!(cells[2] && cells[2].querySelector('.badge')),
+        ];
+    });
+"""
+
+
 @then("each shopcart should show its ID, name, and status")
 def step_impl_shopcart_shows_details(context):
     """Verify that each shopcart in the list shows ID, name, and status."""
-    table = context.browser.find_element(By.ID, "shopcart-table")
-    rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-    # Filter out empty state row
-    data_rows = [row for row in rows if "No shopcarts found" not in row.text]
+    # Filter out the empty state row and summarise the rest in one script call
+    data_rows = context.browser.execute_script(_TABLE_ROWS_JS)
 
     if not data_rows:
         # If no data rows, that's okay if we're testing empty state
         return
 
-    for row in data_rows:
-        cells = row.find_elements(By.TAG_NAME, "td")
+    for cell_count, cart_id, has_badge in data_rows:
         assert (
-            len(cells) >= 3
+            cell_count >= 3
         ), "Each shopcart row should have at least Cart ID, Name, and Status columns"
         # First cell should be Cart ID (customer_id)
-        cart_id = cells[0].text.strip()
         assert (
             cart_id and cart_id.isdigit()
         ), f"Cart ID should be a number, got: {cart_id}"
-        # Second cell should be Name (can be empty, so we just check it exists)
-        _ = cells[1].text.strip()  # Verify name cell exists
         # Third cell should be Status
-        status_cell = cells[2]
-        status_badge = status_cell.find_elements(By.CSS_SELECTOR, ".badge")
-        assert len(status_badge) > 0, "Status should be displayed with a badge"
+        assert has_badge, "Status should be displayed with a badge"
 
 
 @when('I filter by "{status}"')
 def step_impl_filter_by_status(context, status):
     """Apply a status filter to the shopcart list."""
     # Ensure we're on the page first
-    if not context.browser.current_url.startswith(context.base_url):
-        context.browser.get(context.ui_url)
-    # Wait for the list filter form to be available (in "My Shopcarts" panel)
-    list_filter_form = WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "list-filter"))
-    )
-    status_select = list_filter_form.find_element(By.ID, "list-status-filter")
-    from selenium.webdriver.support.ui import Select
+    ensure_on_ui(context)
+    # The list filter form is static markup in the "My Shopcarts" panel
+    page = context.page
 
     # Convert status to canonical (lowercase) value to match HTML option values
     status_value = canonical_status(status)
-    select = Select(status_select)
-    select.select_by_value(status_value)
+    page.act("list_status", lambda el: set_select(context.browser, el, status_value))
     # Submit the form
-    list_filter_form.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-    # Wait for the table to update or error message
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.any_of(
-            EC.presence_of_element_located((By.ID, "shopcart-table")),
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert")),
-        )
-    )
-    # Give additional time for async refreshList() to complete and update the table
-    time.sleep(1)
+    page.act("list_submit", lambda el: el.click())
+    # Wait for the filtered refreshList() to update the table or show an error
+    wait_for_idle(context)
+
+
+_ROW_STATUSES_JS = """
+return Array.from(document.querySelectorAll('#shopcart-table tbody tr'))
+    .filter((row) => row.innerText.trim() && !row.innerText.includes('No shopcarts found'))
+    .map((row) => [row.cells, row.innerText])
+    .filter(([cells]) => cells.length >= 3)
+    .map(([cells, text]) => [cells[2].innerText.trim(), text]);
+"""
 
 
 @then('I should see only the shopcarts with status "{status}"')
 def step_impl_see_filtered_status(context, status):
     """Verify that only shopcarts with the specified status are displayed."""
-    # Wait a bit more to ensure the table has been updated after filtering
-    time.sleep(0.5)
+    # Make sure the filtered refreshList() has rendered the table
+    wait_for_idle(context)
 
-    table = context.browser.find_element(By.ID, "shopcart-table")
-    rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-    data_rows = [
-        row for row in rows if "No shopcarts found" not in row.text and row.text.strip()
-    ]
+    # [status cell text, row text] for every data row, read in one script call
+    data_rows = context.browser.execute_script(_ROW_STATUSES_JS)
 
     if not data_rows:
         # If no rows, that's okay if the filter resulted in no matches
         return
 
-    # Map friendly status to canonical status, then to display label
-    canonical = canonical_status(status)
-    expected_display = status_display_label(canonical)
+    # Map friendly status straight to its display label
+    expected_display = status_display_label(status)
 
     # Verify all rows have the expected status
-    for row in data_rows:
-        cells = row.find_elements(By.TAG_NAME, "td")
-        if len(cells) >= 3:
-            status_cell = cells[2]
-            status_text = status_cell.text.strip()
-            # Status should match the expected display
-            assert (
-                status_text == expected_display
-            ), f"Expected status '{expected_display}' but found '{status_text}' in row. Row content: {row.text}"
+    for status_text, row_text in data_rows:
+        # Status should match the expected display
+        assert (
+            status_text == expected_display
+        ), f"Expected status '{expected_display}' but found '{status_text}' in row. Row content: {row_text}"
 
 
 @when("I try to apply a filter that doesn't exist")
@@ -1053,8 +991,8 @@ def step_impl_invalid_filter(context):
     """Try to apply an invalid filter option."""
     # We'll simulate this by trying to set an invalid status value via JavaScript
     # Since the dropdown only has valid options, we need to manipulate it directly
-    query_form = context.browser.find_element(By.ID, "query-form")
-    status_select = query_form.find_element(By.ID, "status-filter")
+    ensure_on_ui(context)
+    status_select = context.page.query_status
 
     # Set an invalid status value using JavaScript
     # We need to set both the value and trigger change event to ensure it's recognized
@@ -1086,7 +1024,7 @@ def step_impl_invalid_filter(context):
             status_select,
         )
 
-    query_form.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    submit_query_form(context)
 
     # Wait for error message - need to catch it before handleQuery shows "Query completed"
     # The error alert appears from refreshList() before handleQuery() shows "Query completed"
@@ -1094,24 +1032,13 @@ def step_impl_invalid_filter(context):
     context.expected_error = "Invalid filter option"
 
     # Wait for either error alert or "Query completed" (which means error was overwritten)
-    def error_or_query_completed(driver):
-        try:
-            alert = driver.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            alert_text = alert.text.strip().lower()
-            # Check if it's the error message we expect
-            if "invalid filter" in alert_text or "invalid status" in alert_text:
-                return True
-            # Or if "Query completed" appeared (meaning error was overwritten)
-            if "query completed" in alert_text:
-                # Error was overwritten, but we already set expected_error flag
-                return True
-        except Exception:
-            pass
-        return False
+    error_or_query_completed = alert_contains_any(
+        "invalid filter", "invalid status", "query completed"
+    )
 
     try:
-        WebDriverWait(context.browser, WAIT_TIMEOUT).until(error_or_query_completed)
-    except Exception:
+        _wait(context).until(error_or_query_completed)
+    except TimeoutException:
         # If we couldn't catch either, the error might not have appeared
         # This could mean the invalid value wasn't sent to the API
         # In that case, step_impl_error_message will need to handle it
@@ -1121,7 +1048,7 @@ def step_impl_invalid_filter(context):
 @then('I should see a message "No shopcarts found"')
 def step_impl_see_empty_message(context):
     """Verify that the empty state message is displayed."""
-    table = context.browser.find_element(By.ID, "shopcart-table")
+    table = context.browser.find_element(*_LOC_TABLE)
     table_text = table.text
     # Check for either "No shopcarts found" or "No results match your filters"
     assert (
@@ -1139,8 +1066,6 @@ def step_impl_see_empty_message(context):
 def step_impl_active_shopcart_exists(context, customer_id):
     """Create an active shopcart for the given customer."""
     create_cart_via_api(context, customer_id, status="active", name=f"Active Cart {customer_id}")
-    if not hasattr(context, "created_customer_ids"):
-        context.created_customer_ids = set()
     context.created_customer_ids.add(customer_id)
 
 
@@ -1148,8 +1073,6 @@ def step_impl_active_shopcart_exists(context, customer_id):
 def step_impl_shopcart_exists(context, customer_id):
     """Create a shopcart for the given customer with default status."""
     create_cart_via_api(context, customer_id, name=f"Cart {customer_id}")
-    if not hasattr(context, "created_customer_ids"):
-        context.created_customer_ids = set()
     context.created_customer_ids.add(customer_id)
 
 
@@ -1157,7 +1080,7 @@ def step_impl_shopcart_exists(context, customer_id):
 def step_impl_patch_lock(context, customer_id):
     """Send a PATCH request to lock a shopcart."""
     url = _api_url(context, f"shopcarts/{customer_id}/lock")
-    context.response = requests.patch(url, timeout=10)
+    context.response = context.http.patch(url, timeout=10)
     context.customer_id = customer_id
 
 
@@ -1165,7 +1088,7 @@ def step_impl_patch_lock(context, customer_id):
 def step_impl_patch_expire(context, customer_id):
     """Send a PATCH request to expire a shopcart."""
     url = _api_url(context, f"shopcarts/{customer_id}/expire")
-    context.response = requests.patch(url, timeout=10)
+    context.response = context.http.patch(url, timeout=10)
     context.customer_id = customer_id
 
 
@@ -1214,10 +1137,7 @@ def step_impl_not_found_message(context):
 @given("I am viewing the shopcart management list in the Admin UI")
 def step_impl_viewing_management_list(context):
     """Navigate to the shopcart management list."""
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
+    ensure_on_ui(context, refresh=True)
 
 
 @given('I am viewing the shopcart management list')
@@ -1231,31 +1151,16 @@ def step_impl_cart_visible(context, customer_id, status):
     """Ensure a cart with the specified status is visible in the table."""
     # Create the cart if it doesn't exist
     customer_id_int = int(customer_id)
-    status_lower = status.lower()
     # Map status aliases
-    status_map = {
-        "active": "active",
-        "open": "active",
-        "locked": "locked",
-        "expired": "expired",
-        "abandoned": "abandoned",
-    }
-    actual_status = status_map.get(status_lower, status_lower)
+    actual_status = canonical_status(status)
     
     create_cart_via_api(context, customer_id_int, status=actual_status, name=f"Cart {customer_id}")
-    if not hasattr(context, "created_customer_ids"):
-        context.created_customer_ids = set()
     context.created_customer_ids.add(customer_id_int)
     
-    # Refresh the page to see the cart
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
+    # Refresh the list to see the cart
+    ensure_on_ui(context, refresh=True)
     # Wait for the cart to appear in the table
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.text_to_be_present_in_element((By.ID, "shopcart-table"), customer_id)
-    )
+    wait_for_text_in(context, "#shopcart-table", customer_id)
     context.visible_customer_id = customer_id_int
 
 
@@ -1268,24 +1173,13 @@ def step_impl_click_lock(context):
         # Try to get from context
         customer_id = getattr(context, "customer_id", 101)
     
-    action_form = context.browser.find_element(By.ID, "action-form")
-    customer_input = action_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    action_select = action_form.find_element(By.CSS_SELECTOR, "select[name='action']")
-    submit_button = action_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    
-    select = Select(action_select)
-    select.select_by_value("lock")
-    
     # Store initial status for verification
     context.initial_status = "active"
     context.action_customer_id = customer_id
-    
-    submit_button.click()
+
+    submit_action_form(context, customer_id, "lock")
     # Wait for the action to complete
-    time.sleep(1)
+    wait_for_idle(context)
 
 
 @when('I click the "Expire" button for that cart')
@@ -1295,22 +1189,11 @@ def step_impl_click_expire(context):
     if not customer_id:
         customer_id = getattr(context, "customer_id", 202)
     
-    action_form = context.browser.find_element(By.ID, "action-form")
-    customer_input = action_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    action_select = action_form.find_element(By.CSS_SELECTOR, "select[name='action']")
-    submit_button = action_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    
-    select = Select(action_select)
-    select.select_by_value("expire")
-    
     context.initial_status = "active"
     context.action_customer_id = customer_id
-    
-    submit_button.click()
-    time.sleep(1)
+
+    submit_action_form(context, customer_id, "expire")
+    wait_for_idle(context)
 
 
 @then('the cart\'s status should immediately change to "{status}" in the table')
@@ -1320,19 +1203,14 @@ def step_impl_status_changed_in_table(context, status):
     if not customer_id:
         customer_id = getattr(context, "visible_customer_id", 101)
     
-    # Refresh the table or wait for it to update
-    context.browser.refresh()
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
+    # Refresh the table in place or wait for it to update
+    ensure_on_ui(context, refresh=True)
     
     # Wait for the status to appear in the table
-    status_display = status.upper() if status.lower() == "locked" else status.upper()
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.text_to_be_present_in_element((By.ID, "shopcart-table"), status_display)
-    )
+    status_display = status.upper()
+    wait_for_text_in(context, "#shopcart-table", status_display)
     
-    table = context.browser.find_element(By.ID, "shopcart-table")
+    table = context.browser.find_element(*_LOC_TABLE)
     table_text = table.text
     assert str(customer_id) in table_text, f"Customer {customer_id} not found in table"
     assert status_display in table_text or status.lower() in table_text.lower(), \
@@ -1357,33 +1235,29 @@ def step_impl_toast_notification(context, message):
     key_words = expected_keywords.get(message_lower, [w for w in message_lower.split() if len(w) > 3])
     
     # Try to catch the alert immediately (it might be cleared quickly by refreshList)
-    alert_found = False
     alert_text = ""
-    
-    # Check very quickly multiple times since alert appears and disappears fast
-    for attempt in range(20):  # Check 20 times over 2 seconds
-        try:
-            alert = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
-            alert_text = alert.text.lower()
-            # Check if it's an error
-            if "error" in alert_text:
-                raise AssertionError(f"Got error instead of success: {alert_text}")
-            # Check for key words from expected message
-            if key_words:
-                if all(word in alert_text for word in key_words):
-                    alert_found = True
-                    break
-            else:
-                # For other messages, check for partial match
-                matches = sum(1 for word in message_lower.split() if len(word) > 3 and word in alert_text)
-                if matches >= len([w for w in message_lower.split() if len(w) > 3]) // 2:
-                    alert_found = True
-                    break
-        except Exception:
-            # Alert might not exist yet or was cleared - wait briefly and retry
-            time.sleep(0.1)
-            continue
-    
+
+    def toast_matches(driver):
+        nonlocal alert_text
+        # A missing alert reads as "" instead of raising, so nothing is swallowed
+        alert_text = driver.execute_script(_ALERT_TEXT_JS) or ""
+        # Check if it's an error
+        if "error" in alert_text:
+            raise AssertionError(f"Got error instead of success: {alert_text}")
+        # Check for key words from expected message
+        if key_words:
+            return all(word in alert_text for word in key_words)
+        # For other messages, check for partial match
+        matches = sum(1 for word in message_lower.split() if len(word) > 3 and word in alert_text)
+        return matches >= len([w for w in message_lower.split() if len(w) > 3]) // 2
+
+    # Check very quickly since alert appears and disappears fast (2 seconds at most)
+    try:
+        _wait(context, 2).until(toast_matches)
+        alert_found = True
+    except TimeoutException:
+        alert_found = False
+
     # If we couldn't find the alert, but the previous step already verified the status changed,
     # we can consider it a success (the action worked, alert just got cleared too quickly)
     if not alert_found:
@@ -1409,9 +1283,7 @@ def step_impl_about_to_click(context, action, customer_id):
 def step_impl_cart_deleted_before_click(context):
     """Delete the cart via API before the UI action."""
     customer_id = getattr(context, "pending_customer_id", 999)
-    from features.environment import delete_cart_via_api
     delete_cart_via_api(context, customer_id)
-    time.sleep(0.5)  # Small delay to ensure deletion completes
 
 
 @when('I click the "{action}" button for cart "{customer_id}"')
@@ -1420,32 +1292,17 @@ def step_impl_click_action_for_cart(context, action, customer_id):
     customer_id_int = int(customer_id)
     action_lower = action.lower()
     
-    action_form = context.browser.find_element(By.ID, "action-form")
-    customer_input = action_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    action_select = action_form.find_element(By.CSS_SELECTOR, "select[name='action']")
-    submit_button = action_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id_int))
-    
-    select = Select(action_select)
-    if action_lower == "lock":
-        select.select_by_value("lock")
-    elif action_lower == "expire":
-        select.select_by_value("expire")
-    
     context.action_customer_id = customer_id_int
-    submit_button.click()
-    time.sleep(1)
+    submit_action_form(
+        context, customer_id_int, action_lower if action_lower in ("lock", "expire") else None
+    )
+    wait_for_idle(context)
 
 
 @then('I should see an error message saying "{message}"')
 def step_impl_error_message_specific(context, message):
     """Verify a specific error message appears."""
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-    )
-    alert = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
+    alert = wait_for_alert(context)
     alert_text = alert.text.lower()
     message_lower = message.lower()
     # Check for key words from the message (e.g., "cart not found" should match "shopcart for customer '999' was not found")
@@ -1459,11 +1316,9 @@ def step_impl_error_message_specific(context, message):
 def step_impl_cart_removed_from_list(context, customer_id):
     """Verify the cart is no longer in the table."""
     customer_id_int = int(customer_id)
-    context.browser.refresh()
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "shopcart-table"))
-    )
-    table = context.browser.find_element(By.ID, "shopcart-table")
+    # Re-fetch the list in place rather than reloading the page
+    ensure_on_ui(context, refresh=True)
+    table = context.browser.find_element(*_LOC_TABLE)
     table_text = table.text
     assert str(customer_id_int) not in table_text, \
         f"Customer {customer_id_int} should not be in table, but was found"
@@ -1475,15 +1330,17 @@ def step_impl_cart_removed_from_list(context, customer_id):
 @given('a shopcart for customer {customer_id:d} contains multiple items')
 def step_impl_shopcart_with_multiple_items(context, customer_id):
     """Create a shopcart with multiple items for testing totals."""
-    # Create the shopcart
-    create_cart_via_api(context, customer_id)
-    # Add multiple items
-    add_item_via_api(context, customer_id, Decimal("10.50"), product_id=1)
-    add_item_via_api(context, customer_id, Decimal("5.25"), product_id=2)
-    add_item_via_api(context, customer_id, Decimal("3.75"), product_id=3)
+    # Create the shopcart together with multiple items
+    create_cart_via_api(
+        context,
+        customer_id,
+        items=[
+            item_payload(Decimal("10.50"), product_id=1),
+            item_payload(Decimal("5.25"), product_id=2),
+            item_payload(Decimal("3.75"), product_id=3),
+        ],
+    )
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     if customer_id not in context.cleanup_customer_ids:
         context.cleanup_customer_ids.append(customer_id)
 
@@ -1492,8 +1349,6 @@ def step_impl_empty_shopcart(context, customer_id):
     """Create an empty shopcart for testing totals."""
     create_cart_via_api(context, customer_id)
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     if customer_id not in context.cleanup_customer_ids:
         context.cleanup_customer_ids.append(customer_id)
 
@@ -1541,10 +1396,7 @@ def step_impl_totals_response_zeros(context):
 @given('I am viewing my shopcart page in the UI')
 def step_impl_viewing_shopcart_page(context):
     """Navigate to the shopcart page."""
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "create-form"))
-    )
+    ensure_on_ui(context)
 
 @given('I am viewing my shopcart page')
 def step_impl_viewing_shopcart_page_short(context):
@@ -1555,37 +1407,19 @@ def step_impl_viewing_shopcart_page_short(context):
 def step_impl_cart_with_item(context, price, quantity):
     """Create a cart with a specific item."""
     customer_id = 101
-    # Create cart
-    create_cart_via_api(context, customer_id)
-    # Add item with specified price and quantity
-    payload = {
-        "product_id": 1,
-        "quantity": quantity,
-        "price": float(price),
-    }
-    response = requests.post(
-        api_url(context, f"shopcarts/{customer_id}/items"), json=payload, timeout=10
+    # Create cart with the item at the specified price and quantity
+    create_cart_via_api(
+        context, customer_id, items=[item_payload(price, product_id=1, quantity=quantity)]
     )
-    response.raise_for_status()
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     if customer_id not in context.cleanup_customer_ids:
         context.cleanup_customer_ids.append(customer_id)
     # Load the cart in the UI
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "read-form"))
-    )
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    submit_button = read_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    submit_button.click()
+    ensure_on_ui(context)
+    submit_read_form(context, customer_id)
     # Wait for result card to be visible (not hidden)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.visibility_of_element_located((By.ID, "result-card"))
+    _wait(context).until(
+        EC.visibility_of_element_located(_LOC_RESULT_CARD)
     )
 
 @given('my cart is empty')
@@ -1594,41 +1428,30 @@ def step_impl_empty_cart_ui(context):
     customer_id = 202
     create_cart_via_api(context, customer_id)
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     if customer_id not in context.cleanup_customer_ids:
         context.cleanup_customer_ids.append(customer_id)
     # Load the cart in the UI
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "read-form"))
-    )
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    submit_button = read_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    submit_button.click()
+    ensure_on_ui(context)
+    submit_read_form(context, customer_id)
     # Wait for result card to be visible (not hidden)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.visibility_of_element_located((By.ID, "result-card"))
+    _wait(context).until(
+        EC.visibility_of_element_located(_LOC_RESULT_CARD)
     )
 
 @when('the "Cart Summary" component loads')
 def step_impl_cart_summary_loads(context):
     """Wait for the cart summary to load (result card shows totals)."""
     # Wait for result card to be visible (not hidden)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.visibility_of_element_located((By.ID, "result-card"))
+    result_card = _wait(context).until(
+        EC.visibility_of_element_located(_LOC_RESULT_CARD)
     )
-    result_card = context.browser.find_element(By.ID, "result-card")
     # Verify it's actually visible
     assert result_card.is_displayed(), "Result card should be visible"
 
 @then('the "Subtotal" should display "{expected_value}"')
 def step_impl_subtotal_display(context, expected_value):
     """Verify the subtotal displays the expected value."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     card_text = result_card.text
     # The result card shows "Total Price" which equals subtotal (since discount is 0)
     # Look for "Total Price" followed by currency format like $20.00
@@ -1647,7 +1470,7 @@ def step_impl_subtotal_display(context, expected_value):
 @then('the "Total" should display "{expected_value}"')
 def step_impl_total_display(context, expected_value):
     """Verify the total displays the expected value."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     card_text = result_card.text
     # The result card shows "Total Price" which equals total (since discount is 0)
     # Look for "Total Price" followed by currency format
@@ -1664,7 +1487,7 @@ def step_impl_total_display(context, expected_value):
 @then('the "Total Items" should display "{expected_value}"')
 def step_impl_total_items_display(context, expected_value):
     """Verify the total items displays the expected value."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     card_text = result_card.text
     # The result card shows "TOTAL ITEMS" (uppercase) followed by the number
     # Pattern: "TOTAL ITEMS\n2" or "TOTAL ITEMS 2" (case-insensitive)
@@ -1685,36 +1508,14 @@ def step_impl_total_items_display(context, expected_value):
 def step_impl_viewing_with_total(context, current_total):
     """Set up a cart with a known total."""
     customer_id = 301
-    create_cart_via_api(context, customer_id)
-    # Add item to get the specified total
-    payload = {
-        "product_id": 1,
-        "quantity": 1,
-        "price": float(current_total),
-    }
-    response = requests.post(
-        api_url(context, f"shopcarts/{customer_id}/items"), json=payload, timeout=10
-    )
-    response.raise_for_status()
+    # Create it with one item priced at the specified total
+    create_cart_via_api(context, customer_id, items=[item_payload(current_total, product_id=1)])
     # Store for cleanup
-    if not hasattr(context, "cleanup_customer_ids"):
-        context.cleanup_customer_ids = []
     if customer_id not in context.cleanup_customer_ids:
         context.cleanup_customer_ids.append(customer_id)
     # Load in UI
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "read-form"))
-    )
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    submit_button = read_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    submit_button.click()
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "result-card"))
-    )
+    ensure_on_ui(context)
+    submit_read_form(context, customer_id)
 
 @when('I change the quantity of an item, causing the total to update')
 def step_impl_change_quantity(context):
@@ -1724,7 +1525,7 @@ def step_impl_change_quantity(context):
     payload = {
         "quantity": 2,
     }
-    response = requests.patch(
+    response = context.http.patch(
         api_url(context, f"shopcarts/{customer_id}/items/1"), json=payload, timeout=10
     )
     response.raise_for_status()
@@ -1739,36 +1540,17 @@ def step_impl_change_quantity(context):
                 item_updated = True
                 break
     assert item_updated, f"Item quantity was not updated to 2. Cart data: {updated_cart}"
-    # Small delay to ensure backend has processed the update
-    time.sleep(0.3)
+    # The API call above has returned, so the backend has already applied it
     # Reload the cart in the UI to see the updated total
-    # First, wait for the read form to be available
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "read-form"))
-    )
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    submit_button = read_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    submit_button.click()
-    # Wait for alert to appear (indicating cart load started)
-    try:
-        WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-        )
-    except Exception:
-        pass  # Alert might not appear, continue anyway
-    # Wait for result card to be visible and updated
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.visibility_of_element_located((By.ID, "result-card"))
-    )
-    # Wait for the card content to actually load (check for customer ID in the card)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        lambda driver: str(customer_id) in driver.find_element(By.ID, "result-card").text
-    )
-    # Wait a bit more for the data to fully render
-    time.sleep(0.3)
+    submit_read_form(context, customer_id)
+    # Wait for the card to be visible with its content loaded (customer ID in the card)
+    def card_loaded(driver):
+        data = read_panels(driver)
+        return not data["hidden"] and str(customer_id) in data["rtext"]
+
+    _wait(context).until(card_loaded)
+    # Wait for the read request to finish rendering the card
+    wait_for_idle(context)
 
 @then('the "Total" should immediately change to the new calculated total (e.g., "{new_total}") without a page refresh')
 def step_impl_total_updates_immediately(context, new_total):
@@ -1777,25 +1559,21 @@ def step_impl_total_updates_immediately(context, new_total):
     price_pattern = r'Total Price\s*\$(\d+\.\d{2})'
     
     def total_updated(driver):
-        try:
-            result_card = driver.find_element(By.ID, "result-card")
-            if not result_card.is_displayed():
-                return False
-            card_text = result_card.text
-            match = re.search(price_pattern, card_text, re.IGNORECASE)
-            if match:
-                actual_value = match.group(1)
-                return actual_value == new_total
-            return False
-        except Exception:
+        data = read_panels(driver)
+        if data["hidden"]:
             return False
+        match = re.search(price_pattern, data["rtext"], re.IGNORECASE)
+        if match:
+            actual_value = match.group(1)
+            return actual_value == new_total
+        return False
     
     # Wait for the total to update, with better error message
     try:
-        WebDriverWait(context.browser, WAIT_TIMEOUT).until(total_updated)
-    except Exception:
+        _wait(context).until(total_updated)
+    except TimeoutException:
         # Get the current state for debugging
-        result_card = context.browser.find_element(By.ID, "result-card")
+        result_card = context.browser.find_element(*_LOC_RESULT_CARD)
         card_text = result_card.text
         match = re.search(price_pattern, card_text, re.IGNORECASE)
         if match:
@@ -1811,7 +1589,7 @@ def step_impl_total_updates_immediately(context, new_total):
             )
     
     # Verify the final value
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     card_text = result_card.text
     match = re.search(price_pattern, card_text, re.IGNORECASE)
     if match:
@@ -1827,7 +1605,7 @@ def step_impl_subtotal_updates_immediately(context):
     """Verify the subtotal also updated."""
     # Since discount is 0, subtotal = total, so this is already verified
     # But we can check that the result card shows the updated value
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     assert not result_card.get_attribute("hidden"), "Result card should be visible"
 
 @given('my session has expired (cart {customer_id:d} is no longer found)')
@@ -1843,25 +1621,15 @@ def step_impl_session_expired(context, customer_id):
 def step_impl_cart_summary_loads_missing(context):
     """Try to load a missing cart."""
     customer_id = 999
-    context.browser.get(context.ui_url)
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.ID, "read-form"))
-    )
-    read_form = context.browser.find_element(By.ID, "read-form")
-    customer_input = read_form.find_element(By.CSS_SELECTOR, "input[name='customerId']")
-    submit_button = read_form.find_element(By.CSS_SELECTOR, "button[type='submit']")
-    customer_input.clear()
-    customer_input.send_keys(str(customer_id))
-    submit_button.click()
+    ensure_on_ui(context)
+    submit_read_form(context, customer_id)
     # Wait for error message
-    WebDriverWait(context.browser, WAIT_TIMEOUT).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#alerts .alert"))
-    )
+    wait_for_alert(context)
 
 @then('I should see an error message in the summary area saying "{message}"')
 def step_impl_error_in_summary(context, message):
     """Verify error message appears in the summary area."""
-    alert = context.browser.find_element(By.CSS_SELECTOR, "#alerts .alert")
+    alert = wait_for_alert(context)
     alert_text = alert.text.lower()
     message_lower = message.lower()
     # Check for key words - be flexible about error message variations
@@ -1878,7 +1646,7 @@ def step_impl_error_in_summary(context, message):
 @then('the "Total" should display "N/A" or be hidden')
 def step_impl_total_na_or_hidden(context):
     """Verify the total shows N/A or is hidden when cart is not found."""
-    result_card = context.browser.find_element(By.ID, "result-card")
+    result_card = context.browser.find_element(*_LOC_RESULT_CARD)
     # When cart is not found, result card should be hidden or show no total
     if result_card.get_attribute("hidden"):
         # Card is hidden, which is acceptable
@@ -303,6 +303,21 @@ class Shopcart(CRUDMixin, db.Model):
         logger.info("Processing status query for %s ...", status)
         return cls.query.filter(cls.status == status)
 
+    @classmethod
+    def delete_by_customer_ids(cls, customer_ids):
+        """Deletes the Shopcarts for all of the given customer_ids in one commit"""
+        logger.info("Deleting Shopcarts for customer_ids %s ...", customer_ids)
+        shopcarts = cls.query.filter(cls.customer_id.in_(customer_ids)).all()
+        try:
+            for shopcart in shopcarts:
+                db.session.delete(shopcart)
+            db.session.commit()
+        except Exception as error:  # pylint: disable=broad-except
+            db.session.rollback()
+            logger.error("Error deleting Shopcarts for customer_ids: %s", customer_ids)
+            raise DataValidationError(error) from error
+        return len(shopcarts)
+
     @classmethod
     def allowed_statuses(cls):
         """Return the set of valid status values."""
@@ -410,6 +410,23 @@ def _parse_customer_id_filter(value) -> int | None:
         ) from exc
 
 
+def _parse_customer_ids_param(value) -> list[int]:
+    """Parse a required comma-separated list of customer ids."""
+    parts = [part.strip() for part in str(value or "").split(",") if part.strip()]
+    if not parts:
+        raise ValidationError(
+            status.HTTP_400_BAD_REQUEST,
+            "customer_ids is required.",
+        )
+    try:
+        return [int(part) for part in parts]
+    except ValueError as exc:
+        raise ValidationError(
+            status.HTTP_400_BAD_REQUEST,
+            "customer_ids must be a comma-separated list of integers.",
+        ) from exc
+
+
 def _parse_optional_datetime(value, field: str) -> datetime | None:
     """Parse an ISO8601 timestamp when provided."""
     if value is None:
@@ -684,6 +701,21 @@ class ShopcartCollectionResource(Resource):
             {"Location": location_url},
         )
 
+    @ns.doc(
+        "delete_shopcarts",
+        params={"customer_ids": "Comma-separated customer ids whose shopcarts to delete"},
+    )
+    @ns.response(status.HTTP_204_NO_CONTENT, "Shopcarts deleted")
+    @ns.response(status.HTTP_400_BAD_REQUEST, "Invalid customer_ids", message_model)
+    def delete(self):
+        """Delete the Shopcarts for several customers in one request."""
+        try:
+            customer_ids = _parse_customer_ids_param(request.args.get("customer_ids"))
+        except ValidationError as e:
+            abort(e.status_code, message=e.message)
+        Shopcart.delete_by_customer_ids(customer_ids)
+        return "", status.HTTP_204_NO_CONTENT
+
 
 @ns.route("/<int:customer_id>")
 @ns.response(status.HTTP_404_NOT_FOUND, "Shopcart not found", message_model)
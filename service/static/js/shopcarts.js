@@ -190,6 +190,9 @@ const renderTable = (carts) => {
   bindTableActions();
 };
 
+// Number of API requests in flight; UI tests wait for it to return to zero
+window.__pendingOps = 0;
+
 const fetchJson = async (url, { method = "GET", body, headers = {} } = {}) => {
   const options = {
     method,
@@ -202,22 +205,27 @@ const fetchJson = async (url, { method = "GET", body, headers = {} } = {}) => {
     options.body = typeof body === "string" ? body : JSON.stringify(body);
     options.headers["Content-Type"] = "application/json";
   }
-  const response = await fetch(url, options);
-  const text = await response.text();
-  let payload = null;
-  if (text) {
-    try {
-      payload = JSON.parse(text);
-    } catch (error) {
-      console.error("Failed to parse JSON response", error, text);
+  window.__pendingOps += 1;
+  try {
+    const response = await fetch(url, options);
+    const text = await response.text();
+    let payload = null;
+    if (text) {
+      try {
+        payload = JSON.parse(text);
+      } catch (error) {
+        console.error("Failed to parse JSON response", error, text);
+      }
     }
+    if (!response.ok) {
+      const message =
+        payload?.message || payload?.error || `Request failed (${response.status})`;
+      throw new Error(message);
+    }
+    return payload;
+  } finally {
+    window.__pendingOps -= 1;
   }
-  if (!response.ok) {
-    const message =
-      payload?.message || payload?.error || `Request failed (${response.status})`;
-    throw new Error(message);
-  }
-  return payload;
 };
 
 const apiRequest = (path = "", options) => fetchJson(`${API_BASE}${path}`, options);
@@ -654,6 +662,15 @@ if (listResetFilterBtn) {
   listResetFilterBtn.addEventListener("click", handleListResetFilter);
 }
 
+// Module scope hides these helpers from the page, so the UI tests get one
+// explicit hook that returns a loaded page to its on-load state without a reload
+window.__resetShopcartUi = async () => {
+  document.querySelectorAll("form").forEach((form) => form.reset());
+  renderShopcartCard(null);
+  await refreshList();
+  clearAlert();
+};
+
 bindItemForms();
 clearAlert();
 refreshList();
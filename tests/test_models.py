@@ -116,6 +116,30 @@ class TestShopcartModel(TestCase):
         shopcart.delete()
         self.assertEqual(len(Shopcart.all()), 0)
 
+    def test_delete_by_customer_ids(self):
+        """It should Delete the Shopcarts for several customer_ids at once"""
+        shopcarts = ShopcartFactory.create_batch(3)
+        for shopcart in shopcarts:
+            shopcart.create()
+        deleted = Shopcart.delete_by_customer_ids(
+            [shopcarts[0].customer_id, shopcarts[1].customer_id]
+        )
+        self.assertEqual(deleted, 2)
+        remaining = Shopcart.all()
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(remaining[0].customer_id, shopcarts[2].customer_id)
+
+    def test_delete_by_customer_ids_failure(self):
+        """It should raise DataValidationError when a bulk delete fails"""
+        shopcart = ShopcartFactory()
+        shopcart.create()
+        with patch(
+            "service.models.db.session.commit", side_effect=Exception("DB error")
+        ):
+            with self.assertRaises(DataValidationError):
+                Shopcart.delete_by_customer_ids([shopcart.customer_id])
+        db.session.rollback()
+
     def test_list_all_shopcarts(self):
         """It should List all Shopcarts in the database"""
         shopcarts = Shopcart.all()
@@ -1099,6 +1099,29 @@ class TestYourResourceService(TestCase):
         body = response.get_json()
         self.assertIn("was not found", body["message"])
 
+    def test_delete_shopcarts_by_customer_ids(self):
+        """It should Delete several Shopcarts in one request"""
+        shopcarts = self._create_shopcarts(3)
+        ids = f"{shopcarts[0].customer_id},{shopcarts[1].customer_id},0"
+        response = self.client.delete(f"{BASE_URL}?customer_ids={ids}")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(len(response.data), 0)
+        response = self.client.get(BASE_URL)
+        remaining = [cart["customer_id"] for cart in response.get_json()]
+        self.assertEqual(remaining, [shopcarts[2].customer_id])
+
+    def test_delete_shopcarts_requires_customer_ids(self):
+        """It should return 400 when bulk deleting without customer_ids"""
+        response = self.client.delete(BASE_URL)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("customer_ids is required", response.get_json()["message"])
+
+    def test_delete_shopcarts_with_invalid_customer_ids(self):
+        """It should return 400 when bulk deleting with non-integer customer_ids"""
+        response = self.client.delete(f"{BASE_URL}?customer_ids=1,abc")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("comma-separated list", response.get_json()["message"])
+
     # ----------------------------------------------------------
     # TEST UPDATE
     # ----------------------------------------------------------